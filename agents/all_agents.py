@@ -1,10 +1,16 @@
 # agents/all_agents.py
 """
 Agent factory functions for the data analyst system.
-Each function returns a configured CrewAI Agent that shares the same Gemini LLM.
+Each function returns a configured CrewAI Agent that shares the same cached LLM.
 """
 
+import hashlib
+import json
 import os
+import sqlite3
+import threading
+from pathlib import Path
+
 from dotenv import load_dotenv
 from crewai import Agent, LLM
 
@@ -17,11 +23,74 @@ if not api_key:
 
 # os.environ["GEMINI_API_KEY"] = api_key
 
-# Shared LLM configuration used by all agents
-llm = LLM(
+LLM_CACHE_PATH = Path(".llm_cache/responses.sqlite")
+# Agents in async tasks call the LLM from worker threads
+_LLM_CACHE_LOCK = threading.Lock()
+
+
+class CachedLLM(LLM):
+    """
+    LLM that stores text responses in a local sqlite file.
+
+    The key is a sha256 of model, temperature, and messages, so an identical
+    prompt across runs is answered from disk without an API call.
+    Set LLM_CACHE_DISABLED=true in .env to always call the API.
+    """
+
+    def _cache_key(self, messages) -> str:
+        payload = json.dumps(
+            {"m": self.model, "t": self.temperature, "msgs": messages},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _query(sql: str, params: tuple):
+        """Run one statement against the cache file and return the first row."""
+        with _LLM_CACHE_LOCK:
+            LLM_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(LLM_CACHE_PATH)
+            try:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses "
+                    "(key TEXT PRIMARY KEY, response TEXT)"
+                )
+                row = conn.execute(sql, params).fetchone()
+                conn.commit()
+                return row
+            finally:
+                conn.close()
+
+    def call(self, messages, *args, **kwargs):
+        disabled = os.getenv("LLM_CACHE_DISABLED", "").lower() in ("1", "true", "yes")
+        # Native function calling runs tools inside call(), so never replay it
+        uses_tools = bool(args or kwargs.get("tools") or kwargs.get("available_functions"))
+        if disabled or uses_tools:
+            return super().call(messages, *args, **kwargs)
+
+        key = self._cache_key(messages)
+        row = self._query("SELECT response FROM responses WHERE key = ?", (key,))
+        if row is not None:
+            return row[0]
+
+        response = super().call(messages, *args, **kwargs)
+
+        # Only plain text is cached. tool calls and structured output are not
+        if isinstance(response, str):
+            self._query(
+                "INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)",
+                (key, response),
+            )
+        return response
+
+
+# Shared LLM configuration used by all agents.
+# temperature 0 keeps responses repeatable, which is what makes caching useful
+llm = CachedLLM(
     model="openrouter/x-ai/grok-4.1-fast:free",  # can be changed to a different Gemini model if needed
     api_key=os.getenv("OPENROUTER_API_KEY"),
-    temperature=0.7,
+    temperature=0,
     verbose=True,
 )
 
@@ -42,7 +111,7 @@ def create_controller_agent(tools):
     )
 
 
-def create_data_loader_agent(tools):
+def create_data_loader_agent(tools, memory=False):
     """Agent that locates and validates the dataset."""
     return Agent(
         role="Data Loader",
@@ -52,13 +121,13 @@ def create_data_loader_agent(tools):
         llm=llm,
         verbose=True,
         allow_delegation=False,
-        memory=True,
+        memory=memory,
         respect_context_window=True,
         max_iter=2,
     )
 
 
-def create_data_validator_agent(tools):
+def create_data_validator_agent(tools, memory=False):
     """Agent that cleans data and reports basic quality metrics."""
     return Agent(
         role="Data Quality Engineer",
@@ -68,13 +137,13 @@ def create_data_validator_agent(tools):
         llm=llm,
         verbose=True,
         allow_delegation=False,
-        memory=True,
+        memory=memory,
         respect_context_window=True,
         max_iter=2,
     )
 
 
-def create_exploratory_agent(tools):
+def create_exploratory_agent(tools, memory=False):
     """Agent that does exploratory data analysis."""
     return Agent(
         role="Exploratory Analyst",
@@ -84,13 +153,13 @@ def create_exploratory_agent(tools):
         llm=llm,
         verbose=True,
         allow_delegation=False,
-        memory=True,
+        memory=memory,
         respect_context_window=True,
         max_iter=2,
     )
 
 
-def create_statistical_agent(tools):
+def create_statistical_agent(tools, memory=False):
     """Agent that runs core statistical analysis."""
     return Agent(
         role="Statistician",
@@ -100,13 +169,13 @@ def create_statistical_agent(tools):
         llm=llm,
         verbose=True,
         allow_delegation=False,
-        memory=True,
+        memory=memory,
         respect_context_window=True,
         max_iter=2,
     )
 
 
-def create_anomaly_detector_agent(tools):
+def create_anomaly_detector_agent(tools, memory=False):
     """Agent that focuses on anomalies and outliers."""
     return Agent(
         role="Anomaly Specialist",
@@ -116,13 +185,13 @@ def create_anomaly_detector_agent(tools):
         llm=llm,
         verbose=True,
         allow_delegation=False,
-        memory=True,
+        memory=memory,
         respect_context_window=True,
         max_iter=2,
     )
 
 
-def create_visualization_agent(tools):
+def create_visualization_agent(tools, memory=False):
     """Agent that creates charts and short visual summaries."""
     return Agent(
         role="Visualization Designer",
@@ -132,7 +201,7 @@ def create_visualization_agent(tools):
         llm=llm,
         verbose=True,
         allow_delegation=False,
-        memory=True,
+        memory=memory,
         respect_context_window=True,
         max_iter=2,
     )
@@ -1,6 +1,5 @@
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
 
 print("Generating sample e-commerce data...")
 np.random.seed(42)
@@ -9,53 +8,59 @@ np.random.seed(42)
 dates = pd.date_range('2024-07-01', '2024-09-30', freq='D')
 categories = ['Electronics', 'Clothing', 'Food & Beverage', 'Home & Garden']
 
-data = []
-for date in dates:
-    day_num = (date - dates[0]).days
-    
-    for category in categories:
-        # Base revenue by category
-        base_revenue = {'Electronics': 45000, 'Clothing': 32000, 
-                       'Food & Beverage': 28000, 'Home & Garden': 35000}[category]
-        
-        # Add trends
-        if category == 'Electronics':
-            trend = -day_num * 250  # Declining
-        elif category == 'Clothing':
-            trend = day_num * 150   # Growing
-        else:
-            trend = np.random.uniform(-50, 50) * day_num
-        
-        # September anomaly for Electronics
-        anomaly = np.random.uniform(-8000, -12000) if (category == 'Electronics' and date.month == 9) else 0
-        
-        # Calculate metrics
-        revenue = max(base_revenue + trend + anomaly + np.random.normal(0, 3000), 5000)
-        orders = int(revenue / np.random.uniform(85, 125))
-        conversion_rate = np.random.uniform(2.5, 4.5)
-        
-        data.append({
-            'date': date.strftime('%Y-%m-%d'),
-            'category': category,
-            'revenue': round(revenue, 2),
-            'orders': orders,
-            'conversion_rate': round(conversion_rate, 2),
-            'avg_order_value': round(revenue/orders, 2),
-            'website_traffic': int(orders / (conversion_rate/100)),
-            'marketing_spend': round(revenue * np.random.uniform(0.08, 0.15), 2)
-        })
-
-df = pd.DataFrame(data)
+# Every metric is a (days, categories) matrix; rows are dates, columns categories
+n_days, n_cats = len(dates), len(categories)
+shape = (n_days, n_cats)
+day_num = np.arange(n_days)[:, None]
+cat_idx = np.arange(n_cats)[None, :]
+month = dates.month.to_numpy()[:, None]
+
+# Base revenue by category
+base_revenue = np.array([45000, 32000, 28000, 35000])
+
+# Add trends. Electronics declining, Clothing growing, others random
+trend = np.where(
+    cat_idx == 0, -250,
+    np.where(cat_idx == 1, 150, np.random.uniform(-50, 50, size=shape))
+) * day_num
+
+# September anomaly for Electronics
+anomaly = np.where(
+    (cat_idx == 0) & (month == 9),
+    np.random.uniform(-8000, -12000, size=shape),
+    0,
+)
+
+# Calculate metrics
+revenue = np.maximum(
+    base_revenue + trend + anomaly + np.random.normal(0, 3000, size=shape), 5000
+)
+orders = (revenue / np.random.uniform(85, 125, size=shape)).astype(int)
+conversion_rate = np.random.uniform(2.5, 4.5, size=shape)
+
+df = pd.DataFrame({
+    'date': np.repeat(dates.date, n_cats),
+    'category': pd.Categorical(np.tile(categories, n_days), categories=categories),
+    'revenue': revenue.round(2).ravel(),
+    'orders': orders.ravel(),
+    'conversion_rate': conversion_rate.round(2).ravel(),
+    'avg_order_value': (revenue / orders).round(2).ravel(),
+    'website_traffic': (orders / (conversion_rate / 100)).astype(int).ravel(),
+    'marketing_spend': (revenue * np.random.uniform(0.08, 0.15, size=shape)).round(2).ravel(),
+})
 
 # Add data quality issues (realistic)
 for col in ['revenue', 'orders']:
     mask = np.random.random(len(df)) < 0.05
     df.loc[mask, col] = np.nan
 
-# Add duplicates
-df = pd.concat([df, df.sample(15)], ignore_index=True).sample(frac=1).reset_index(drop=True)
+# Add duplicates and shuffle, as one row index gather
+dup = np.random.choice(len(df), 15, replace=False)
+idx = np.concatenate([np.arange(len(df)), dup])
+np.random.shuffle(idx)
+df = df.iloc[idx].reset_index(drop=True)
 
-# Save
-df.to_csv('data/ecommerce_q3_2024.csv', index=False)
+# Save as Parquet. date32 date, dictionary encoded category, typed metrics
+df.to_parquet('data/ecommerce_q3_2024.parquet', engine='pyarrow', compression='zstd', index=False)
 print(f"✅ Generated {len(df)} rows of sample data")
-print(f"   Saved to: data/ecommerce_q3_2024.csv")
\ No newline at end of file
+print(f"   Saved to: data/ecommerce_q3_2024.parquet")
@@ -8,7 +8,6 @@ Covers:
 """
 
 import os
-import json
 from pathlib import Path
 import pandas as pd
 
@@ -35,15 +34,23 @@ def test_case_missing_dataset():
         print("Base dataset missing. Skipping this test.")
         return None
 
-    temp_path = BASE_DATASET.with_suffix(".bak")
+    # The loader matches by name, so hide every CSV and Parquet copy of the
+    # dataset, not just the one RAW_FILE points at
+    hidden = [
+        p
+        for p in Path(DATA_DIR).rglob(f"*{DATASET_HINT}*")
+        if p.suffix in (".csv", ".parquet")
+    ]
 
     # Temporarily hide dataset
-    BASE_DATASET.rename(temp_path)
+    for p in hidden:
+        p.rename(p.with_name(p.name + ".bak"))
     try:
         result = run_analysis(run_tag="missing_dataset")
     finally:
-        # Restore file
-        temp_path.rename(BASE_DATASET)
+        # Restore files
+        for p in hidden:
+            p.with_name(p.name + ".bak").rename(p)
 
     return result
 
@@ -54,14 +61,18 @@ def test_case_missing_revenue_column():
         print("Base dataset missing. Skipping test.")
         return None
 
-    df = pd.read_csv(BASE_DATASET)
+    is_parquet = BASE_DATASET.suffix == ".parquet"
+    df = pd.read_parquet(BASE_DATASET) if is_parquet else pd.read_csv(BASE_DATASET)
     if "revenue" not in df.columns:
         print("Revenue already missing. Skipping test.")
         return None
 
-    # Write modified dataset
-    alt_path = Path(DATA_DIR) / f"{DATASET_HINT}_no_revenue.csv"
-    df.drop(columns=["revenue"]).to_csv(alt_path, index=False)
+    # Write modified dataset in the same format as the base file
+    alt_path = Path(DATA_DIR) / f"{DATASET_HINT}_no_revenue{BASE_DATASET.suffix}"
+    if is_parquet:
+        df.drop(columns=["revenue"]).to_parquet(alt_path, index=False)
+    else:
+        df.drop(columns=["revenue"]).to_csv(alt_path, index=False)
 
     # Override RAW_FILE for this run
     os.environ["EVAL_RAW_FILE_OVERRIDE"] = str(alt_path)
@@ -102,18 +113,15 @@ def analyze_metrics():
         print("No metrics file. Run tests first.")
         return
 
-    records = []
-    with open(log_path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                records.append(json.loads(line))
+    if log_path.stat().st_size == 0:
+        print("No records found.")
+        return
 
-    if not records:
+    df = pd.read_json(log_path, lines=True)
+    if df.empty:
         print("No records found.")
         return
 
-    df = pd.DataFrame(records)
     print("\n====================")
     print(" EVALUATION SUMMARY ")
     print("====================")
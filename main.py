@@ -10,9 +10,11 @@ Steps:
 6. Use previous evaluation metrics as feedback for the controller agent.
 """
 
+import functools
 import os
 import json
 from datetime import datetime
+from difflib import SequenceMatcher
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -32,6 +34,7 @@ from tools.builtin_tools import (  # noqa: E402
     analyze_statistics,
     clean_data,
     create_chart,
+    create_charts,
     load_dataset,
 )
 from tools.smart_insight_generator import generate_insights  # noqa: E402
@@ -62,7 +65,10 @@ print("✓ API key loaded")
 
 DATASET_HINT = "ecommerce_q3_2024"
 DATA_DIR = "data"
-RAW_FILE = f"{DATA_DIR}/{DATASET_HINT}.csv"
+# generate_data.py writes Parquet. fall back to the committed CSV
+RAW_FILE = f"{DATA_DIR}/{DATASET_HINT}.parquet"
+if not Path(RAW_FILE).exists():
+    RAW_FILE = f"{DATA_DIR}/{DATASET_HINT}.csv"
 
 # Optional override used by evaluation.py to point to variant datasets
 _raw_override = os.getenv("EVAL_RAW_FILE_OVERRIDE")
@@ -74,10 +80,27 @@ if _raw_override:
 # Feedback loop. use past evaluation metrics as context
 # --------------------------------------------------------------------
 
+def _cap_tokens(text: str, max_tokens: int = 500) -> str:
+    """
+    Trim text to roughly max_tokens, cutting at a line boundary.
+
+    Uses the common 4 characters per token estimate, which is close enough
+    for a budget and needs no tokenizer.
+    """
+    max_chars = max_tokens * 4
+    if len(text) <= max_chars:
+        return text
+
+    kept = text[:max_chars].rsplit("\n", 1)[0]
+    return kept + "\n(feedback truncated)"
+
+
 def load_feedback_summary(
     log_path: str = "outputs/eval/metrics.jsonl",
     max_runs: int = 5,
-) -> str:
+    max_tokens: int = 500,
+    return_skip_flag: bool = False,
+):
     """
     Read recent evaluation runs and produce a short feedback summary
     that the controller agent can use to improve the workflow.
@@ -85,12 +108,22 @@ def load_feedback_summary(
     This is a simple feedback loop across runs.
     It does not change code automatically. it gives the controller
     information about success rates and typical failures.
+    The summary is capped at max_tokens so it stays cheap in the prompt.
+
+    With return_skip_flag, returns (summary, skip_plan). skip_plan is True
+    when there is nothing for the controller to react to. That is a first
+    run, an empty log, or only successes in the recent runs.
     """
+
+    def done(summary: str, skip_plan: bool = False):
+        return (summary, skip_plan) if return_skip_flag else summary
+
     path = Path(log_path)
     if not path.exists():
-        return (
+        return done(
             "No prior evaluation runs found. "
-            "You are running the workflow for the first time."
+            "You are running the workflow for the first time.",
+            skip_plan=True,
         )
 
     records = []
@@ -102,13 +135,13 @@ def load_feedback_summary(
                     continue
                 records.append(json.loads(line))
     except Exception:
-        return (
+        return done(
             "Evaluation log exists but could not be parsed. "
             "Assume there may have been past failures."
         )
 
     if not records:
-        return "Evaluation log is empty. No feedback available."
+        return done("Evaluation log is empty. No feedback available.", skip_plan=True)
 
     # Keep only the most recent runs
     records = sorted(records, key=lambda r: r.get("start_time", ""))[-max_runs:]
@@ -123,9 +156,13 @@ def load_feedback_summary(
         for r in records
         if not r.get("success") and r.get("error_message")
     ]
+    # Near duplicates (same error, different ids or paths) count once
     unique_errors = []
     for e_msg in errors:
-        if e_msg not in unique_errors:
+        if not any(
+            SequenceMatcher(None, seen, e_msg).ratio() > 0.85
+            for seen in unique_errors
+        ):
             unique_errors.append(e_msg)
     unique_errors = unique_errors[:3]
 
@@ -141,12 +178,15 @@ def load_feedback_summary(
     else:
         summary_lines.append("No recurring runtime errors detected in recent runs.")
 
-    return "\n".join(summary_lines)
+    return done(
+        _cap_tokens("\n".join(summary_lines), max_tokens=max_tokens),
+        skip_plan=successes == total,
+    )
 
 
 # Main business questions
 query = f"""
-Analyze Q3 2024 sales data from {DATASET_HINT}.csv:
+Analyze Q3 2024 sales data from {DATASET_HINT}:
 1. Why did revenue drop in September?
 2. Which categories underperformed?
 3. What can we say about marketing spend vs revenue?
@@ -154,143 +194,160 @@ Analyze Q3 2024 sales data from {DATASET_HINT}.csv:
 5. What should we do in Q4?
 """
 
-# Feedback context passed into the controller task
-feedback_context = load_feedback_summary()
-
-
-# --------------------------------------------------------------------
-# Agent creation
-# --------------------------------------------------------------------
-
-controller = create_controller_agent(
-    tools=[load_dataset, generate_insights, clean_data, analyze_statistics, create_chart]
+# Used instead of the controller task when feedback gives it nothing to adjust
+DEFAULT_PLAN = (
+    "Default workflow plan. Load the dataset, clean it, then run "
+    "exploratory, statistical, anomaly, and visualization analysis on the "
+    "cleaned data, and finish with the executive report."
 )
-loader = create_data_loader_agent([load_dataset])
-validator = create_data_validator_agent([clean_data])
-exploratory = create_exploratory_agent([analyze_statistics, create_chart])
-statistical = create_statistical_agent([analyze_statistics])
-anomaly = create_anomaly_detector_agent([analyze_statistics])
-visualizer = create_visualization_agent([create_chart, generate_insights])
-reporter = create_report_generator_agent([generate_insights])
-
 
 # --------------------------------------------------------------------
-# Task definitions
+# Agents, tasks, and crew. built once per process
 # --------------------------------------------------------------------
 
-t0 = Task(
-    description=(
-        "You are the controller agent for this analysis.\n"
-        f"Main business questions.\n{query}\n"
-        "You also receive feedback from previous evaluation runs.\n"
-        f"{feedback_context}\n\n"
-        "Your goals.\n"
-        "1. Summarize key objectives for this run.\n"
-        "2. Outline the order in which specialized agents should act and why.\n"
-        "3. Highlight data quality or tooling risks that other agents should watch for.\n"
-        "4. If recent runs had failures, adjust the workflow plan to reduce the same errors.\n"
-    ),
-    agent=controller,
-    expected_output="Short workflow plan that references feedback when relevant.",
-)
-
-t1 = Task(
-    description=(
-        f"Locate the dataset for Q3 2024 ecommerce analysis.\n"
-        f"- Search under '{DATA_DIR}' for a CSV containing the name '{DATASET_HINT}'.\n"
-        "- Use the CSV Data Loader tool.\n"
-        "- If multiple files match, prefer the one with the most rows.\n"
-        "- Return JSON with status, path, rows, and columns.\n"
-    ),
-    agent=loader,
-    expected_output="JSON with status, path, rows, and columns.",
-)
-
-t2 = Task(
-    description=(
-        "Clean the dataset.\n"
-        "- Use the path returned by the Data Loader task if available. "
-        f"Otherwise fall back to '{RAW_FILE}'.\n"
-        "- Handle missing values and remove duplicates.\n"
-        "- Return JSON with original_rows, clean_rows, and clean_path.\n"
-    ),
-    agent=validator,
-    expected_output="JSON with original_rows, clean_rows, and clean_path.",
-)
-
-t3 = Task(
-    description=(
-        "Run exploratory data analysis on the cleaned dataset.\n"
-        "- Focus on revenue by month and category.\n"
-        "- Describe high level patterns in plain language.\n"
-        "- Point out any obvious shifts across July, August, and September.\n"
-    ),
-    agent=exploratory,
-    expected_output="Narrative summary of key patterns.",
-)
-
-t4 = Task(
-    description=(
-        "Use the Statistical Analyzer tool on the cleaned dataset.\n"
-        "- Target column should be revenue.\n"
-        "- Report mean, standard deviation, and trend information.\n"
-        "- Highlight any strong correlations with other numeric columns.\n"
-        "- Return the JSON result for possible downstream use.\n"
-    ),
-    agent=statistical,
-    expected_output="JSON with statistics and correlations.",
-)
-
-t5 = Task(
-    description=(
-        "Identify anomalies using the exploratory context and any statistical output.\n"
-        "- Pay special attention to September compared to July and August.\n"
-        "- Describe any obvious outliers or strange values.\n"
-        "- Suggest possible causes in simple terms.\n"
-    ),
-    agent=anomaly,
-    expected_output="Short anomaly report with likely causes.",
-)
-
-t6 = Task(
-    description=(
-        "Create visualizations and, if possible, convert stats to short insights.\n"
-        "- Use the cleaned dataset.\n"
-        "- Create at least two charts.\n"
-        "  1) Revenue by category over time.\n"
-        "  2) Marketing vs revenue or another useful comparison.\n"
-        "- Save charts to outputs/visualizations.\n"
-        "- If you have JSON stats, you may call the Smart Insight Generator "
-        "to produce a short text block of insights.\n"
-    ),
-    agent=visualizer,
-    expected_output="List of chart paths and any generated insight text.",
-)
-
-t7 = Task(
-    description=(
-        "Write the final executive report.\n"
-        "Requirements.\n"
-        "1) Explain why revenue dropped in September, based on the data.\n"
-        "2) List which categories underperformed.\n"
-        "3) Summarize what we can say about marketing spend vs revenue.\n"
-        "4) Note any clear anomalies.\n"
-        "5) Give concrete, business friendly recommendations for Q4.\n"
-        "- If JSON stats are available, you may use the Smart Insight Generator.\n"
-        "- Do not mention internal tools, agent names, or system errors.\n"
-        "- Write for a VP of Sales who wants clear, concise answers.\n"
-    ),
-    agent=reporter,
-    expected_output="Executive style report that answers all five points.",
-)
-
-
-# --------------------------------------------------------------------
-# Crew definition
-# --------------------------------------------------------------------
+@functools.lru_cache(maxsize=2)
+def get_crew(skip_plan: bool = False) -> Crew:
+    """
+    Build the agents, tasks, and crew once and reuse them across runs.
 
-crew = Crew(
-    agents=[
+    Values that change between runs are passed as kickoff inputs
+    instead of being baked into task descriptions.
+    With skip_plan the controller task t0 is left out, saving one LLM
+    call. The loader then gets DEFAULT_PLAN through {plan} instead.
+    """
+    controller = create_controller_agent(
+        tools=[load_dataset, generate_insights, clean_data, analyze_statistics, create_chart]
+    )
+    loader = create_data_loader_agent([load_dataset])
+    validator = create_data_validator_agent([clean_data])
+    exploratory = create_exploratory_agent([analyze_statistics, create_chart])
+    statistical = create_statistical_agent([analyze_statistics])
+    anomaly = create_anomaly_detector_agent([analyze_statistics])
+    visualizer = create_visualization_agent([create_charts, create_chart, generate_insights])
+    reporter = create_report_generator_agent([generate_insights])
+
+    # Tasks. t0-t2 run in order. t3-t6 only need the cleaned dataset, so
+    # they run concurrently (async_execution). t7 collects their outputs
+    # via context. {feedback}, {plan}, and {raw_file} are filled in per run from
+    # the kickoff inputs.
+
+    t0 = Task(
+        description=(
+            "You are the controller agent for this analysis.\n"
+            f"Main business questions.\n{query}\n"
+            "You also receive feedback from previous evaluation runs.\n"
+            "{feedback}\n\n"
+            "Your goals.\n"
+            "1. Summarize key objectives for this run.\n"
+            "2. Outline the order in which specialized agents should act and why.\n"
+            "3. Highlight data quality or tooling risks that other agents should watch for.\n"
+            "4. If recent runs had failures, adjust the workflow plan to reduce the same errors.\n"
+        ),
+        agent=controller,
+        expected_output="Short workflow plan that references feedback when relevant.",
+    )
+
+    t1 = Task(
+        description=(
+            f"Locate the dataset for Q3 2024 ecommerce analysis.\n"
+            "{plan}\n"
+            f"- Search under '{DATA_DIR}' for a CSV or Parquet file containing the name '{DATASET_HINT}'.\n"
+            "- Use the CSV Data Loader tool.\n"
+            "- If multiple files match, prefer the one with the most rows.\n"
+            "- Return JSON with status, path, rows, and columns.\n"
+        ),
+        agent=loader,
+        expected_output="JSON with status, path, rows, and columns.",
+    )
+
+    t2 = Task(
+        description=(
+            "Clean the dataset.\n"
+            "- Use the path returned by the Data Loader task if available. "
+            "Otherwise fall back to '{raw_file}'.\n"
+            "- Handle missing values and remove duplicates.\n"
+            "- Return JSON with original_rows, clean_rows, and clean_path.\n"
+            "- clean_path is a memory:// handle. Later tools accept it as data_path.\n"
+        ),
+        agent=validator,
+        expected_output="JSON with original_rows, clean_rows, and clean_path.",
+    )
+
+    t3 = Task(
+        description=(
+            "Run exploratory data analysis on the cleaned dataset.\n"
+            "- Focus on revenue by month and category.\n"
+            "- Describe high level patterns in plain language.\n"
+            "- Point out any obvious shifts across July, August, and September.\n"
+        ),
+        agent=exploratory,
+        expected_output="Narrative summary of key patterns.",
+        async_execution=True,
+    )
+
+    t4 = Task(
+        description=(
+            "Use the Statistical Analyzer tool on the cleaned dataset.\n"
+            "- Target column should be revenue.\n"
+            "- Report mean, standard deviation, and trend information.\n"
+            "- Highlight any strong correlations with other numeric columns.\n"
+            "- Return the JSON result for possible downstream use.\n"
+        ),
+        agent=statistical,
+        expected_output="JSON with statistics and correlations.",
+        async_execution=True,
+    )
+
+    t5 = Task(
+        description=(
+            "Identify anomalies in the cleaned dataset.\n"
+            "- Use the Statistical Analyzer tool to get the statistics you need.\n"
+            "- Pay special attention to September compared to July and August.\n"
+            "- Describe any obvious outliers or strange values.\n"
+            "- Suggest possible causes in simple terms.\n"
+        ),
+        agent=anomaly,
+        expected_output="Short anomaly report with likely causes.",
+        async_execution=True,
+    )
+
+    t6 = Task(
+        description=(
+            "Create visualizations and, if possible, convert stats to short insights.\n"
+            "- Use the cleaned dataset.\n"
+            "- Create at least two charts.\n"
+            "  1) Revenue by category over time.\n"
+            "  2) Marketing vs revenue or another useful comparison.\n"
+            "- Save charts to outputs/visualizations.\n"
+            "- Prefer the Batch Chart Creator to render all charts in one call.\n"
+            "- If you have JSON stats, you may call the Smart Insight Generator "
+            "to produce a short text block of insights.\n"
+        ),
+        agent=visualizer,
+        expected_output="List of chart paths and any generated insight text.",
+        async_execution=True,
+    )
+
+    t7 = Task(
+        description=(
+            "Write the final executive report.\n"
+            "Requirements.\n"
+            "1) Explain why revenue dropped in September, based on the data.\n"
+            "2) List which categories underperformed.\n"
+            "3) Summarize what we can say about marketing spend vs revenue.\n"
+            "4) Note any clear anomalies.\n"
+            "5) Give concrete, business friendly recommendations for Q4.\n"
+            "- If JSON stats are available, you may use the Smart Insight Generator.\n"
+            "- Do not mention internal tools, agent names, or system errors.\n"
+            "- Write for a VP of Sales who wants clear, concise answers.\n"
+        ),
+        agent=reporter,
+        expected_output="Executive style report that answers all five points.",
+        # Waits for the four parallel analysis tasks above
+        context=[t3, t4, t5, t6],
+    )
+
+    agents = [
         controller,
         loader,
         validator,
@@ -299,12 +356,20 @@ crew = Crew(
         anomaly,
         visualizer,
         reporter,
-    ],
-    tasks=[t0, t1, t2, t3, t4, t5, t6, t7],
-    process=Process.sequential,
-    verbose=True,
-    memory=False,  # per agent memory stays in the agent factory config
-)
+    ]
+    tasks = [t0, t1, t2, t3, t4, t5, t6, t7]
+    if skip_plan:
+        agents, tasks = agents[1:], tasks[1:]
+
+    crew = Crew(
+        agents=agents,
+        tasks=tasks,
+        process=Process.sequential,
+        verbose=True,
+        memory=False,  # per agent memory stays in the agent factory config
+    )
+
+    return crew
 
 
 # --------------------------------------------------------------------
@@ -324,8 +389,16 @@ def run_analysis(run_tag: str = "baseline") -> dict:
     error_msg = None
     result_text = ""
 
+    feedback, skip_plan = load_feedback_summary(return_skip_flag=True)
+    crew = get_crew(skip_plan=skip_plan)
+    inputs = {
+        "feedback": feedback,
+        "plan": DEFAULT_PLAN if skip_plan else "Follow the controller's workflow plan.",
+        "raw_file": os.getenv("EVAL_RAW_FILE_OVERRIDE") or RAW_FILE,
+    }
+
     try:
-        result = crew.kickoff()
+        result = crew.kickoff(inputs=inputs)
         result_text = str(result)
     except Exception as e:
         success = False
@@ -0,0 +1,59 @@
+# tools/_stats_kernel.py
+"""
+Numba compiled statistics kernel for the Statistical Analyzer.
+
+Imported lazily by builtin_tools so numba is only loaded when the tool runs.
+Input must be a finite float64 matrix, one column per numeric variable.
+Compiled without parallel=True. Async crew tasks call the analyzer from
+several threads at once, which numba's workqueue threading layer aborts on.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def stats_kernel(arr, ti):
+    """
+    Return (mean, std, slope, r2, corr) for column ti of arr.
+
+    std uses ddof=1 like pandas. slope and r2 are for a line fit against
+    the row index. corr holds the Pearson correlation of column ti with
+    every column.
+    """
+    n = arr.shape[0]
+    k = arr.shape[1]
+    col = arr[:, ti]
+
+    mean = col.mean()
+    x_mean = (n - 1) / 2.0
+    ss_y = 0.0
+    ss_x = 0.0
+    s_xy = 0.0
+    for i in range(n):
+        dy = col[i] - mean
+        dx = i - x_mean
+        ss_y += dy * dy
+        ss_x += dx * dx
+        s_xy += dx * dy
+
+    std = np.sqrt(ss_y / (n - 1)) if n > 1 else np.nan
+    slope = s_xy / ss_x if ss_x > 0 else 0.0
+    r2 = s_xy * s_xy / (ss_x * ss_y) if ss_x > 0 and ss_y > 0 else 0.0
+
+    corr = np.empty(k)
+    for j in range(k):
+        other = arr[:, j]
+        o_mean = other.mean()
+        s_yo = 0.0
+        ss_o = 0.0
+        for i in range(n):
+            do = other[i] - o_mean
+            s_yo += (col[i] - mean) * do
+            ss_o += do * do
+        if ss_o > 0 and ss_y > 0:
+            corr[j] = s_yo / np.sqrt(ss_y * ss_o)
+        else:
+            corr[j] = np.nan
+
+    return mean, std, slope, r2, corr
@@ -3,26 +3,325 @@
 Built in tools used by the agents.
 
 Tools:
-- CSV Data Loader. locate and validate a dataset.
-- Data Cleaner. basic cleaning and row counts.
+- CSV Data Loader. locate and validate a CSV or Parquet dataset.
+- Data Cleaner. basic cleaning and row counts, kept in memory or saved as Parquet.
 - Statistical Analyzer. simple stats and correlations.
-- Chart Creator. export basic Plotly charts as HTML.
+- Chart Creator. export basic charts as PNG, or Plotly HTML on request.
+- Batch Chart Creator. render several charts from one load in parallel.
 """
 
+import functools
+import hashlib
 import json
+import math
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 import plotly.express as px
+import pyarrow as pa
+import pyarrow.parquet as pq
 from crewai.tools import tool
-from scipy import stats
+from matplotlib.figure import Figure
+from pyarrow import csv
+
+
+# Known column types for the ecommerce dataset. Passing these to the Arrow
+# reader skips type inference. Columns not listed here are still inferred.
+# orders is float because the generator writes it with NaNs ("199.0").
+SCHEMA = pa.schema(
+    [
+        ("date", pa.date32()),
+        ("category", pa.dictionary(pa.int32(), pa.string())),
+        ("revenue", pa.float64()),
+        ("orders", pa.float64()),
+        ("conversion_rate", pa.float32()),
+        ("avg_order_value", pa.float32()),
+        ("website_traffic", pa.int32()),
+        ("marketing_spend", pa.float64()),
+    ]
+)
+
+
+def _read_csv(path, columns=None) -> pd.DataFrame:
+    """
+    Read a CSV with the multithreaded Arrow parser and return a DataFrame.
+
+    columns limits which columns are converted at all. Files that do not
+    fit SCHEMA (for example dates written as 07/01/2024) are read again
+    with inferred types.
+    """
+    try:
+        table = csv.read_csv(
+            str(path),
+            convert_options=csv.ConvertOptions(
+                column_types=SCHEMA, include_columns=columns
+            ),
+        )
+    except pa.ArrowInvalid:
+        table = csv.read_csv(
+            str(path), convert_options=csv.ConvertOptions(include_columns=columns)
+        )
+    return table.to_pandas(date_as_object=False)
+
+
+def _read_any(path, columns=None) -> pd.DataFrame:
+    """
+    Read a Parquet file by suffix, otherwise treat path as CSV.
+
+    Only columns are read when given. category is always returned as a
+    pandas categorical. The CSV schema already dictionary encodes it;
+    Parquet written elsewhere may not. date is always datetime64, whether
+    it came from a CSV string or a Parquet date32 column.
+    """
+    if Path(path).suffix.lower() == ".parquet":
+        df = pd.read_parquet(path, engine="pyarrow", columns=columns)
+    else:
+        df = _read_csv(path, columns=columns)
+
+    if "category" in df.columns and not isinstance(
+        df["category"].dtype, pd.CategoricalDtype
+    ):
+        df["category"] = df["category"].astype("category")
+    if "date" in df.columns and not pd.api.types.is_datetime64_any_dtype(df["date"]):
+        try:
+            df["date"] = pd.to_datetime(df["date"])
+        except (ValueError, TypeError):
+            pass
+    return df
+
+
+def _is_numeric(pa_type) -> bool:
+    return pa.types.is_integer(pa_type) or pa.types.is_floating(pa_type)
+
+
+def _column_info(path) -> tuple:
+    """
+    Return (all column names, numeric column names) without reading rows.
+
+    Parquet reads the footer and CSV parses the first block only. memory://
+    frames are already loaded, so their dtypes are used directly.
+    """
+    if str(path).startswith(MEMORY_PREFIX):
+        df = _load(path, copy=False)
+        numeric = df.select_dtypes(include=[np.number]).columns
+        return list(df.columns), list(numeric)
+
+    if Path(path).suffix.lower() == ".parquet":
+        schema = pq.read_schema(path)
+    else:
+        try:
+            reader = csv.open_csv(
+                str(path), convert_options=csv.ConvertOptions(column_types=SCHEMA)
+            )
+        except pa.ArrowInvalid:
+            # Same fallback as _read_csv
+            reader = csv.open_csv(str(path))
+        schema = reader.schema
+        reader.close()
+
+    names = list(schema.names)
+    return names, [f.name for f in schema if _is_numeric(f.type)]
+
+
+# Parsed frames shared across tool calls, keyed by (realpath, mtime_ns, size)
+# so an edited or replaced file is read again.
+_DF_CACHE: "OrderedDict[tuple, pd.DataFrame]" = OrderedDict()
+_CACHE_MAX = 4
+# Async crew tasks call tools from worker threads
+_CACHE_LOCK = threading.Lock()
+
+# Cleaned frames handed between tools in this process as memory://<id> paths
+MEMORY_PREFIX = "memory://"
+_MEM_STORE: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
+
+
+def _source_key(path) -> tuple:
+    """Cache key for a file version: (realpath, mtime_ns, size)."""
+    st = os.stat(path)
+    return os.path.realpath(path), st.st_mtime_ns, st.st_size
+
+
+def _load(path, copy: bool = True, columns=None) -> pd.DataFrame:
+    """
+    Return the parsed DataFrame for path, reading it at most once per version.
+
+    With columns, only those are returned, and only those are read from
+    disk unless the full frame is already cached.
+    memory:// paths are served from the in-process store filled by
+    clean_data. Pass copy=False only from tools that do not mutate the frame.
+    """
+    if str(path).startswith(MEMORY_PREFIX):
+        with _CACHE_LOCK:
+            df = _MEM_STORE.get(str(path)[len(MEMORY_PREFIX):])
+        if df is None:
+            raise FileNotFoundError(
+                f"{path} is not in memory. Run the Data Cleaner again "
+                "or pass a file path."
+            )
+        if columns is not None:
+            return df[columns].copy() if copy else df[columns]
+        return df.copy() if copy else df
+
+    base_key = _source_key(path)
+    key = base_key if columns is None else (*base_key, tuple(columns))
+
+    with _CACHE_LOCK:
+        df = _DF_CACHE.get(key)
+        if df is not None:
+            _DF_CACHE.move_to_end(key)
+        elif columns is not None and base_key in _DF_CACHE:
+            # Project from the full frame instead of going back to disk
+            _DF_CACHE.move_to_end(base_key)
+            return _DF_CACHE[base_key][columns].copy()
+
+    if df is None:
+        df = _read_any(path, columns=columns)
+        with _CACHE_LOCK:
+            _DF_CACHE[key] = df
+            if len(_DF_CACHE) > _CACHE_MAX:
+                _DF_CACHE.popitem(last=False)
+
+    return df.copy() if copy else df
+
+
+def _stats_numpy(arr: np.ndarray, ti: int):
+    """NumPy version of tools._stats_kernel.stats_kernel, used without numba."""
+    n = arr.shape[0]
+    col = arr[:, ti]
+    dev = arr - arr.mean(axis=0)
+    dy = dev[:, ti]
+    dx = np.arange(n, dtype=np.float64) - (n - 1) / 2.0
+
+    ss_y = float(dy @ dy)
+    ss_x = float(dx @ dx)
+    s_xy = float(dx @ dy)
+    ss_cols = (dev * dev).sum(axis=0)
+
+    std = float(np.sqrt(ss_y / (n - 1))) if n > 1 else float("nan")
+    slope = s_xy / ss_x if ss_x > 0 else 0.0
+    r2 = s_xy * s_xy / (ss_x * ss_y) if ss_x > 0 and ss_y > 0 else 0.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = (dy @ dev) / np.sqrt(ss_y * ss_cols)
+    corr[ss_cols == 0] = np.nan
+
+    return float(col.mean()), std, slope, r2, corr
+
+
+def _trend_with_gaps(y: np.ndarray) -> tuple:
+    """
+    Return (slope, r2, n) of y against its row index, skipping NaNs.
+
+    Rows keep their original position, so a gap stays a gap in x.
+    """
+    present = ~np.isnan(y)
+    x = np.flatnonzero(present).astype(np.float64)
+    y = y[present]
+    n = len(y)
+    if n < 2:
+        return 0.0, 0.0, n
+
+    dx = x - x.mean()
+    dy = y - y.mean()
+    ss_x = float(dx @ dx)
+    ss_y = float(dy @ dy)
+    s_xy = float(dx @ dy)
+    slope = s_xy / ss_x
+    r2 = s_xy * s_xy / (ss_x * ss_y) if ss_y > 0 else 0.0
+    return slope, r2, n
+
+
+def _t_two_sided_p(t_stat: float, dof: int) -> float:
+    """
+    Two sided p value of a Student t statistic.
+
+    For dof >= 10, maps t to a standard normal z (Abramowitz and Stegun
+    26.7.8) and uses erfc. Absolute error is under 0.002 and shrinks as
+    dof grows, which is enough to read significance without scipy. Below
+    that the approximation is poor, so the exact finite series for integer
+    dof (A and S 26.7.3 and 26.7.4) is used instead.
+    """
+    if dof < 10:
+        theta = math.atan(abs(t_stat) / math.sqrt(dof))
+        c2 = math.cos(theta) ** 2
+        if dof % 2:
+            # Odd dof: (2 / pi) * (theta + sin cos * (1 + 2/3 c2 + ...))
+            term = total = 1.0
+            for k in range(3, dof - 1, 2):
+                term *= c2 * (k - 1) / k
+                total += term
+            series = math.sin(theta) * math.cos(theta) * total if dof > 1 else 0.0
+            return 1.0 - 2.0 / math.pi * (theta + series)
+        # Even dof: sin * (1 + 1/2 c2 + 1*3/(2*4) c2^2 + ...)
+        term = total = 1.0
+        for k in range(2, dof, 2):
+            term *= c2 * (k - 1) / k
+            total += term
+        return 1.0 - math.sin(theta) * total
+
+    z = t_stat * (1 - 1 / (4 * dof)) / math.sqrt(1 + t_stat * t_stat / (2 * dof))
+    return math.erfc(abs(z) / math.sqrt(2))
+
+
+@functools.lru_cache(maxsize=1)
+def _stats_kernel():
+    """Return the Numba stats kernel, or the NumPy fallback if numba is missing."""
+    try:
+        from ._stats_kernel import stats_kernel
+    except ImportError:
+        return _stats_numpy
+    return stats_kernel
+
+
+def _tree_stamp(data_dir: str) -> tuple:
+    """
+    Return (path, mtime_ns) for data_dir and every directory below it.
+
+    Adding or removing a file changes its directory's mtime, so this is the
+    cache key for _list_datasets. Only directories are stat'ed.
+    """
+    stamp = []
+    stack = [data_dir]
+    while stack:
+        d = stack.pop()
+        stamp.append((d, os.stat(d).st_mtime_ns))
+        with os.scandir(d) as it:
+            stack.extend(e.path for e in it if e.is_dir(follow_symlinks=False))
+    return tuple(sorted(stamp))
+
+
+@functools.lru_cache(maxsize=8)
+def _list_datasets(data_dir: str, stamp: tuple) -> tuple:
+    """
+    List CSV and Parquet files under data_dir.
+
+    Raw files come before *_cleaned outputs, and Parquet before CSV.
+    stamp is the _tree_stamp of data_dir and lists every directory to scan.
+    """
+    files = []
+    for d, _ in stamp:
+        with os.scandir(d) as it:
+            files.extend(
+                Path(e.path)
+                for e in it
+                if e.name.endswith((".parquet", ".csv")) and e.is_file()
+            )
+    return tuple(
+        sorted(
+            files,
+            key=lambda p: (p.stem.endswith("_cleaned"), p.suffix != ".parquet", str(p)),
+        )
+    )
 
 
 @tool("CSV Data Loader")
 def load_dataset(dataset_name: str, data_dir: str = "data") -> str:
     """
-    Locate a CSV file by name inside a data directory.
+    Locate a CSV or Parquet file by name inside a data directory.
 
     Returns a JSON string with status, path, and basic info.
     """
@@ -35,27 +334,26 @@ def load_dataset(dataset_name: str, data_dir: str = "data") -> str:
             }
         )
 
-    candidates = list(base.rglob("*.csv"))
-    matched = [p for p in candidates if dataset_name.lower() in p.name.lower()]
+    candidates = _list_datasets(str(base), _tree_stamp(str(base)))
+    needle = dataset_name.lower()
+    path = next((p for p in candidates if needle in p.name.lower()), None)
 
-    if not matched:
+    if path is None:
         return json.dumps(
             {
                 "status": "error",
-                "message": f"No CSV files matching '{dataset_name}' under {base.resolve()}",
+                "message": f"No CSV or Parquet files matching '{dataset_name}' under {base.resolve()}",
                 "searched_files": [str(p) for p in candidates],
             }
         )
 
-    path = matched[0]
-
     try:
-        df = pd.read_csv(path)
+        df = _load(path, copy=False)
     except Exception as e:
         return json.dumps(
             {
                 "status": "error",
-                "message": f"Failed to read CSV at {path}: {e}",
+                "message": f"Failed to read dataset at {path}: {e}",
             }
         )
 
@@ -69,52 +367,77 @@ def load_dataset(dataset_name: str, data_dir: str = "data") -> str:
 
 
 @tool("Data Cleaner")
-def clean_data(data_path: str) -> str:
+def clean_data(data_path: str, persist: bool = False) -> str:
     """
-    Clean dataset and save to a new file.
+    Clean dataset and keep the result in memory for the other tools.
 
     Fills numeric missing values with medians and drops duplicate rows.
+    clean_path is a memory:// handle that the analyzer and chart tools accept.
+    With persist=True the cleaned data is also saved next to the source as
+    Parquet and its path returned as saved_path. persist is ignored for
+    memory:// sources.
     Returns a JSON string with clean_path and row counts.
     """
     try:
-        df = pd.read_csv(data_path)
+        df = _load(data_path)
     except Exception as e:
         return json.dumps(
             {
                 "status": "error",
-                "message": f"Failed to read CSV at {data_path}: {e}",
+                "message": f"Failed to read dataset at {data_path}: {e}",
             }
         )
 
     original = len(df)
 
-    # Fill missing numeric values with median, without chained assignment
-    for col in df.select_dtypes(include=[np.number]).columns:
-        median_val = df[col].median()
-        df[col] = df[col].fillna(median_val)
+    # Fill missing numeric values with their column medians in one pass
+    num_cols = df.select_dtypes(include=[np.number]).columns
+    df[num_cols] = df[num_cols].fillna(df[num_cols].median())
 
     # Remove duplicate rows
     df.drop_duplicates(inplace=True)
 
-    clean_path = data_path.replace(".csv", "_cleaned.csv")
-    try:
-        df.to_csv(clean_path, index=False)
-    except Exception as e:
-        return json.dumps(
-            {
-                "status": "error",
-                "message": f"Failed to write cleaned CSV to {clean_path}: {e}",
-            }
-        )
+    # Hand the frame over in memory, no encode and decode round trip. The
+    # handle depends only on the source version, so prompts that mention it
+    # stay identical across runs and the LLM response cache can hit
+    if str(data_path).startswith(MEMORY_PREFIX):
+        src_key = data_path
+    else:
+        src_key = _source_key(data_path)
+    uid = hashlib.blake2b(repr(src_key).encode(), digest_size=8).hexdigest()
+    with _CACHE_LOCK:
+        _MEM_STORE[uid] = df
+        if len(_MEM_STORE) > _CACHE_MAX:
+            _MEM_STORE.popitem(last=False)
+
+    result = {
+        "status": "ok",
+        "original_rows": int(original),
+        "clean_rows": int(len(df)),
+        "clean_path": f"{MEMORY_PREFIX}{uid}",
+    }
 
-    return json.dumps(
-        {
-            "status": "ok",
-            "original_rows": int(original),
-            "clean_rows": int(len(df)),
-            "clean_path": clean_path,
-        }
-    )
+    # Parquet keeps dtypes, so readers in other processes skip CSV parsing.
+    # A memory:// source has no directory to save next to
+    if persist and str(data_path).startswith(MEMORY_PREFIX):
+        result["message"] = "persist ignored: memory:// input has no file location."
+    elif persist:
+        src = Path(data_path)
+        saved_path = str(src.with_name(f"{src.stem}_cleaned.parquet"))
+        try:
+            df.to_parquet(saved_path, engine="pyarrow", compression="zstd", index=False)
+        except Exception as e:
+            # The in memory handle is still valid, so keep it in the reply
+            return json.dumps(
+                {
+                    **result,
+                    "status": "error",
+                    "message": f"Failed to write cleaned Parquet to {saved_path}: {e}",
+                }
+            )
+        result["saved_path"] = saved_path
+
+    return json.dumps(result)
 
 
 @tool("Statistical Analyzer")
@@ -125,37 +448,57 @@ def analyze_statistics(data_path: str, target: str = "revenue") -> str:
     Returns a JSON string with mean, std, trend info, and correlations.
     """
     try:
-        df = pd.read_csv(data_path)
+        names, numeric = _column_info(data_path)
+        if target in names:
+            # Only the numeric columns (and the target) are read
+            cols = numeric if target in numeric else [*numeric, target]
+            df = _load(data_path, copy=False, columns=cols)
     except Exception as e:
         return json.dumps(
             {
                 "status": "error",
-                "message": f"Failed to read CSV at {data_path}: {e}",
+                "message": f"Failed to read dataset at {data_path}: {e}",
             }
         )
 
-    if target not in df.columns:
+    if target not in names:
         return json.dumps(
             {
                 "status": "error",
                 "message": f"Target column '{target}' not found in dataset.",
-                "available_columns": list(df.columns),
+                "available_columns": names,
             }
         )
 
     try:
+        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        t_idx = numeric_cols.get_loc(target)
+        arr = np.ascontiguousarray(df[numeric_cols].to_numpy(dtype=np.float64))
+        if not np.isnan(arr).any():
+            # Complete data. Trend against row index and correlations in one pass
+            _, _, slope, r2, corr_vec = _stats_kernel()(arr, t_idx)
+            n = arr.shape[0]
+        else:
+            # Missing values. Fit the trend on the target's own rows and
+            # correlate each pair over the rows where both are present
+            slope, r2, n = _trend_with_gaps(arr[:, t_idx])
+            corr_vec = df[numeric_cols].corrwith(df[target]).to_numpy()
         mean_val = df[target].mean()
         std_val = df[target].std()
 
-        # Simple time index for trend
-        x = np.arange(len(df))
-        y = df[target].values
-        slope, _, r_val, p_val, _ = stats.linregress(x, y)
+        # Two sided p value for slope != 0 from the t statistic. Undefined
+        # below three points
+        if n < 3:
+            p_val = float("nan")
+        elif r2 < 1.0:
+            t_stat = math.sqrt(r2 * (n - 2) / (1.0 - r2))
+            p_val = _t_two_sided_p(t_stat, n - 2)
+        else:
+            p_val = 0.0
 
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
         corr = {
-            col: float(df[target].corr(df[col]))
-            for col in numeric_cols
+            col: float(corr_vec[i])
+            for i, col in enumerate(numeric_cols)
             if col != target
         }
 
@@ -166,7 +509,7 @@ def analyze_statistics(data_path: str, target: str = "revenue") -> str:
             "std": float(std_val),
             "trend": {
                 "slope": float(slope),
-                "r2": float(r_val**2),
+                "r2": float(r2),
                 "p_value": float(p_val),
                 "direction": (
                     "increasing"
@@ -188,6 +531,104 @@ def analyze_statistics(data_path: str, target: str = "revenue") -> str:
         )
 
 
+def _is_categorical(s: pd.Series) -> bool:
+    """True for columns without a numeric or datetime scale, like category."""
+    return not (
+        pd.api.types.is_numeric_dtype(s) or pd.api.types.is_datetime64_any_dtype(s)
+    )
+
+
+def _render_chart(df: pd.DataFrame, chart_type: str, x: str, y: str) -> dict:
+    """
+    Render one chart from df into outputs/visualizations.
+
+    Returns the result dict that the chart tools serialize. Safe to call
+    from several threads at once for different (chart_type, x, y), which
+    always get different file names.
+    """
+    output_dir = Path("outputs/visualizations")
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Interactive Plotly HTML, opt in only
+    if chart_type == "interactive":
+        path = output_dir / f"{chart_type}_{y}_by_{x}.html"
+        try:
+            fig = px.line(df, x=x, y=y, title=f"{y} over time")
+            fig.write_html(str(path))
+        except Exception as e:
+            return {
+                "status": "error",
+                "message": f"Failed to save chart HTML to {path}: {e}",
+            }
+        return {
+            "status": "ok",
+            "chart_type": chart_type,
+            "x": x,
+            "y": y,
+            "path": str(path),
+        }
+
+    # Build the figure. Figure is used directly, without pyplot global state
+    try:
+        fig = Figure(figsize=(8, 4.5))
+        ax = fig.subplots()
+        if chart_type in ("line", "bar"):
+            agg = df.groupby(x, observed=True, sort=True)[y].sum()
+            if chart_type == "line":
+                ax.plot(agg.index, agg.to_numpy())
+                ax.set_title(f"{y} over time")
+            else:
+                ax.bar(agg.index.astype(str), agg.to_numpy())
+                ax.set_title(f"{y} by {x}")
+        else:
+            sub = df[list(dict.fromkeys([x, y]))].dropna()
+            xs, ys = sub[x], sub[y].to_numpy(dtype=np.float64)
+            ax.scatter(xs.astype(str) if _is_categorical(xs) else xs, ys, s=10)
+            # Fitted line for numeric and datetime x. Dates are fitted in
+            # nanoseconds and the line end points converted back
+            if not _is_categorical(xs) and xs.nunique() > 1:
+                is_dt = pd.api.types.is_datetime64_any_dtype(xs)
+                if is_dt:
+                    xn = xs.to_numpy(dtype="datetime64[ns]").view(np.int64)
+                else:
+                    xn = xs.to_numpy()
+                xn = xn.astype(np.float64)
+                slope, intercept = np.polyfit(xn, ys, 1)
+                line_xn = np.array([xn.min(), xn.max()])
+                line_x = (
+                    line_xn.astype(np.int64).astype("datetime64[ns]")
+                    if is_dt
+                    else line_xn
+                )
+                ax.plot(line_x, slope * line_xn + intercept, color="tab:red")
+            ax.set_title(f"{y} vs {x}")
+        ax.set_xlabel(x)
+        ax.set_ylabel(y)
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Error while creating chart: {e}",
+        }
+
+    path = output_dir / f"{chart_type}_{y}_by_{x}.png"
+
+    try:
+        fig.savefig(str(path), dpi=100, bbox_inches="tight")
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Failed to save chart PNG to {path}: {e}",
+        }
+
+    return {
+        "status": "ok",
+        "chart_type": chart_type,
+        "x": x,
+        "y": y,
+        "path": str(path),
+    }
+
+
 @tool("Chart Creator")
 def create_chart(
     data_path: str,
@@ -196,65 +637,109 @@ def create_chart(
     y: str = "revenue",
 ) -> str:
     """
-    Create a simple chart and save it as an HTML file.
+    Create a simple chart and save it as a PNG file.
 
+    line and bar plot y summed per x value. Any other type is a scatter,
+    with a fitted line when x is numeric or a date. chart_type
+    "interactive" saves a Plotly HTML line chart instead.
     Returns a JSON string with the saved chart path.
     """
     try:
-        df = pd.read_csv(data_path)
+        names, _ = _column_info(data_path)
+        if x in names and y in names:
+            # Only the plotted columns are read
+            df = _load(data_path, copy=False, columns=list(dict.fromkeys([x, y])))
     except Exception as e:
         return json.dumps(
             {
                 "status": "error",
-                "message": f"Failed to read CSV at {data_path}: {e}",
+                "message": f"Failed to read dataset at {data_path}: {e}",
             }
         )
 
-    if x not in df.columns or y not in df.columns:
+    if x not in names or y not in names:
         return json.dumps(
             {
                 "status": "error",
                 "message": f"Columns '{x}' or '{y}' not found in dataset.",
-                "available_columns": list(df.columns),
+                "available_columns": names,
             }
         )
 
-    # Build the figure
-    try:
-        if chart_type == "line":
-            fig = px.line(df, x=x, y=y, title=f"{y} over time")
-        elif chart_type == "bar":
-            fig = px.bar(df, x=x, y=y, title=f"{y} by {x}")
-        else:
-            fig = px.scatter(df, x=x, y=y, trendline="ols")
-    except Exception as e:
+    return json.dumps(_render_chart(df, chart_type, x, y))
+
+
+@tool("Batch Chart Creator")
+def create_charts(data_path: str, specs: list) -> str:
+    """
+    Create several charts from one dataset in parallel.
+
+    specs is a list (or JSON list) of objects with chart_type, x, and y,
+    using the same defaults and chart types as Chart Creator.
+    Returns a JSON string with one result per spec, in order.
+    """
+    if isinstance(specs, str):
+        try:
+            specs = json.loads(specs)
+        except Exception as e:
+            return json.dumps(
+                {
+                    "status": "error",
+                    "message": f"specs must be a JSON list of chart specs: {e}",
+                }
+            )
+
+    if not specs or not isinstance(specs, list) or not all(
+        isinstance(spec, dict) for spec in specs
+    ):
         return json.dumps(
             {
                 "status": "error",
-                "message": f"Error while creating chart: {e}",
+                "message": "specs must be a non empty list of objects with chart_type, x, and y.",
             }
         )
 
-    output_dir = Path("outputs/visualizations")
-    output_dir.mkdir(parents=True, exist_ok=True)
-    path = output_dir / f"{chart_type}_{y}.html"
+    specs = [
+        {
+            "chart_type": spec.get("chart_type", "line"),
+            "x": spec.get("x", "date"),
+            "y": spec.get("y", "revenue"),
+        }
+        for spec in specs
+    ]
 
     try:
-        fig.write_html(str(path))
+        names, _ = _column_info(data_path)
+        wanted = [c for s in specs for c in (s["x"], s["y"]) if c in names]
+        # Load once with every plotted column, shared by all renders
+        df = _load(data_path, copy=False, columns=list(dict.fromkeys(wanted)))
     except Exception as e:
         return json.dumps(
             {
                 "status": "error",
-                "message": f"Failed to save chart HTML to {path}: {e}",
+                "message": f"Failed to read dataset at {data_path}: {e}",
             }
         )
 
+    def _one(spec: dict) -> dict:
+        if spec["x"] not in names or spec["y"] not in names:
+            return {
+                "status": "error",
+                "message": f"Columns '{spec['x']}' or '{spec['y']}' not found in dataset.",
+                "available_columns": names,
+            }
+        return _render_chart(df, spec["chart_type"], spec["x"], spec["y"])
+
+    # Identical specs would write the same file, so each is rendered once
+    keys = [(s["chart_type"], s["x"], s["y"]) for s in specs]
+    unique = dict(zip(keys, specs))
+    with ThreadPoolExecutor(max_workers=min(8, len(unique))) as ex:
+        rendered = dict(zip(unique, ex.map(_one, unique.values())))
+    charts = [rendered[k] for k in keys]
+
     return json.dumps(
         {
-            "status": "ok",
-            "chart_type": chart_type,
-            "x": x,
-            "y": y,
-            "path": str(path),
+            "status": "ok" if all(c["status"] == "ok" for c in charts) else "error",
+            "charts": charts,
         }
     )
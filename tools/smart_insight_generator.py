@@ -3,74 +3,112 @@
 Custom tool that turns numeric analysis results into short business insights.
 """
 
-import json
-from datetime import datetime
+import functools
+import time
 
+import msgspec
+import numpy as np
 from crewai.tools import tool
 
 
-@tool("Smart Insight Generator")
-def generate_insights(analysis_results: str) -> str:
-    """
-    Convert analysis JSON into a short insight and action summary.
+# Report pieces. The body after the timestamp is built as one parts list
+_HEADER = "\nANALYSIS INSIGHTS | "
+_FINDINGS = "\n\nFINDINGS:\n"
+_ACTIONS = "\nACTIONS:\n"
+_NO_ACTIONS = "  1. LOW: No specific actions identified.\n"
+_CONFIDENCE_OK = "\nConfidence: 85 percent | Quality: Good\n"
 
-    Accepts a JSON string or dict from Statistical Analyzer or similar tools.
-    """
-    # Parse input into a dict
-    if isinstance(analysis_results, str):
-        try:
-            data = json.loads(analysis_results)
-        except Exception:
-            data = {"raw": analysis_results}
-    else:
-        data = analysis_results
+# Whole body for an upstream error. The header and timestamp are added later
+_ERR_TMPL = (
+    "\n\nFINDINGS:\n"
+    "  - Analysis tool reported an error: {msg}\n\n"
+    "ACTIONS:\n"
+    "  1. Check dataset path and column names.\n"
+    "  2. Re run the analysis after fixing data issues.\n\n"
+    "Confidence: 40 percent | Quality: Limited (tool error)\n"
+)
 
-    insights = []
-    recommendations = []
 
-    # If upstream reported an error, note it and return early
-    if data.get("status") == "error":
-        msg = data.get("message", "Unknown analysis error.")
-        insights.append(f"Analysis tool reported an error: {msg}")
-        actions = [
-            "Check dataset path and column names.",
-            "Re run the analysis after fixing data issues.",
-        ]
-        actions_block = "\n".join(
-            [f"  {i+1}. {a}" for i, a in enumerate(actions)]
-        )
+# Trend directions that call for a revenue investigation
+_DECREASING = frozenset({"decreasing", "decrease", "down", "declining"})
 
-        report = f"""
-ANALYSIS INSIGHTS | {datetime.now().strftime('%Y-%m-%d %H:%M')}
+# Below this many correlations a plain loop beats the NumPy call overhead
+_NUMPY_MIN_CORR = 8
 
-FINDINGS:
-  - {insights[0]}
 
-ACTIONS:
-{actions_block}
+class TrendT(msgspec.Struct):
+    """Trend block of an analysis result. Absent fields stay UNSET."""
+    direction: str | msgspec.UnsetType = msgspec.UNSET
+    slope: float | msgspec.UnsetType = msgspec.UNSET
 
-Confidence: 40 percent | Quality: Limited (tool error)
-"""
-        return report
+
+# A trend object without known fields is skipped, like an empty dict was
+_EMPTY_TREND = TrendT()
+
+
+class AnalysisT(msgspec.Struct):
+    """Fields of an analysis result that the report reads. Others are ignored."""
+    status: str = ""
+    message: str = "Unknown analysis error."
+    trend: TrendT | None = None
+    correlations: dict[str, float] = {}
+    segments: dict[str, float] = {}
+
+
+_DEC = msgspec.json.Decoder(AnalysisT)
+
+
+def _now() -> str:
+    """Report timestamp. time.strftime avoids building a datetime object."""
+    return time.strftime("%Y-%m-%d %H:%M")
+
+
+def _format_report(body: str) -> str:
+    """Stamp the current time onto a report body."""
+    return "".join((_HEADER, _now(), body))
+
+
+def _body_from_analysis(data: AnalysisT) -> str:
+    """Build the report text that follows the timestamp."""
+    # If upstream reported an error, note it and return early
+    if data.status == "error":
+        return _ERR_TMPL.format(msg=data.message)
+
+    insights = []
+    recommendations = []
 
     # Trend insight
-    trend = data.get("trend")
-    if trend:
-        direction = trend.get("direction", "stable")
-        slope = trend.get("slope", 0.0)
+    trend = data.trend
+    if trend is not None and trend != _EMPTY_TREND:
+        direction = "stable" if trend.direction is msgspec.UNSET else trend.direction
+        slope = 0.0 if trend.slope is msgspec.UNSET else trend.slope
         insights.append(
             f"Revenue trend is {direction} with slope {slope:.4f} over the period."
         )
-        if direction.startswith("decreas"):
+        if direction in _DECREASING:
             recommendations.append(
                 "HIGH: Investigate the reasons for the downward revenue trend."
             )
 
     # Correlation insight
-    correlations = data.get("correlations", {})
+    correlations = data.correlations
     if correlations:
-        top = max(correlations.items(), key=lambda x: abs(x[1]))
-        col, val = top
+        # Strongest by absolute value. NaN (undefined) correlations are
+        # skipped unless every value is NaN
+        keys = list(correlations)
+        if len(keys) >= _NUMPY_MIN_CORR:
+            vals = np.fromiter(
+                (correlations[k] for k in keys), dtype=np.float64, count=len(keys)
+            )
+            idx = int(np.nan_to_num(np.abs(vals), nan=-1.0).argmax())
+        else:
+            idx, best_abs = 0, -1.0
+            for n, k in enumerate(keys):
+                a = abs(correlations[k])
+                if a > best_abs:
+                    idx, best_abs = n, a
+        col = keys[idx]
+        val = float(correlations[col])
         insights.append(
             f"Strongest correlation is between revenue and {col}: {val:.2f}."
         )
@@ -80,10 +118,18 @@ Confidence: 40 percent | Quality: Limited (tool error)
             )
 
     # Segment or category insight if provided
-    segments = data.get("segments")
+    segments = data.segments
     if segments:
-        best = max(segments.items(), key=lambda x: x[1])
-        worst = min(segments.items(), key=lambda x: x[1])
+        # One pass for both ends. ties keep the first segment, like max/min
+        it = iter(segments.items())
+        bk, bv = next(it)
+        wk, wv = bk, bv
+        for k, v in it:
+            if v > bv:
+                bk, bv = k, v
+            elif v < wv:
+                wk, wv = k, v
+        best, worst = (bk, bv), (wk, wv)
         gap = ((best[1] - worst[1]) / max(worst[1], 1e-6)) * 100
         insights.append(
             f"{best[0]} segment leads, {worst[0]} lags, with about {gap:.0f} percent gap."
@@ -98,19 +144,92 @@ Confidence: 40 percent | Quality: Limited (tool error)
             "LOW: Run the full statistical analysis before acting on this data."
         )
 
-    actions_block = "\n".join(
-        [f"  {i+1}. {r}" for i, r in enumerate(recommendations)]
-    ) or "  1. LOW: No specific actions identified."
+    parts = [_FINDINGS]
+    for i in insights:
+        parts.extend(("  - ", i, "\n"))
+    parts.append(_ACTIONS)
+    if recommendations:
+        for n, r in enumerate(recommendations, 1):
+            parts.extend(("  ", str(n), ". ", r, "\n"))
+    else:
+        parts.append(_NO_ACTIONS)
+    parts.append(_CONFIDENCE_OK)
+    return "".join(parts)
 
-    report = f"""
-ANALYSIS INSIGHTS | {datetime.now().strftime('%Y-%m-%d %H:%M')}
 
-FINDINGS:
-{chr(10).join([f'  - {i}' for i in insights])}
+def _fits(name: str, value) -> bool:
+    """True if value is valid for the AnalysisT field name."""
+    try:
+        msgspec.convert({name: value}, AnalysisT)
+    except msgspec.ValidationError:
+        return False
+    return True
 
-ACTIONS:
-{actions_block}
 
-Confidence: 85 percent | Quality: Good
-"""
-    return report
+def _to_analysis(obj) -> AnalysisT:
+    """
+    Convert already parsed JSON to AnalysisT.
+
+    A field with the wrong type is dropped on its own, as is a bad entry
+    (such as null) in correlations or segments, so the rest of the payload
+    is still reported. Input that is not an object gets the defaults.
+    """
+    try:
+        return msgspec.convert(obj, AnalysisT)
+    except msgspec.ValidationError:
+        if not isinstance(obj, dict):
+            return AnalysisT()
+
+    kept = {}
+    for name in AnalysisT.__struct_fields__:
+        if name not in obj:
+            continue
+        value = obj[name]
+        if name in ("correlations", "segments") and isinstance(value, dict):
+            value = {k: v for k, v in value.items() if _fits(name, {k: v})}
+        if _fits(name, value):
+            kept[name] = value
+    return msgspec.convert(kept, AnalysisT)
+
+
+@functools.lru_cache(maxsize=256)
+def _build_report_body(analysis_results: str) -> str:
+    """
+    Parse analysis JSON and build its report body.
+
+    Everything except the timestamp depends only on the input string, so
+    agent retries with the same analysis JSON are served from the cache.
+    """
+    try:
+        data = _DEC.decode(analysis_results)
+    except msgspec.DecodeError:
+        # A field of the wrong type, or NaN literals (which json.dumps writes
+        # for empty correlations and msgspec rejects). json parses both, and
+        # _to_analysis keeps whatever still fits. Anything else is raw text
+        import json
+
+        try:
+            data = _to_analysis(json.loads(analysis_results))
+        except ValueError:
+            data = AnalysisT()
+    return _body_from_analysis(data)
+
+
+def _generate_insights_from_dict(data: dict) -> str:
+    """Same report as generate_insights, for Python callers holding a dict."""
+    return _format_report(_body_from_analysis(_to_analysis(data)))
+
+
+def _generate_insights_impl(analysis_results: str) -> str:
+    """generate_insights without the CrewAI tool wrapper, for Python callers."""
+    return _format_report(_build_report_body(analysis_results))
+
+
+@tool("Smart Insight Generator")
+def generate_insights(analysis_results: str) -> str:
+    """
+    Convert analysis JSON into a short insight and action summary.
+
+    Accepts the JSON string from Statistical Analyzer or similar tools.
+    """
+    return _generate_insights_impl(analysis_results)